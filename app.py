@@ -6,11 +6,20 @@ import pytz
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
+from urllib3.util.request import ACCEPT_ENCODING
+import lxml.html
 from urllib.parse import urljoin
 import logging
-import xml.etree.ElementTree as ET
+from lxml import etree as ET
+from io import BytesIO
 import re
+import orjson
+import diskcache
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, Future
+from threading import Lock
+from functools import wraps, lru_cache
+from dataclasses import dataclass
 
 
 
@@ -33,6 +42,15 @@ URL_REQUERIMENTOS = "https://www.camara.leg.br/pplen/requerimentos-proposicao.ht
 URL_DESTAQUES = "https://www.camara.leg.br/pplen/destaques.html"
 URL_PARECERES = "https://www.camara.leg.br/proposicoesWeb/prop_pareceres_substitutivos_votos"
 
+# identifica PRLP/PRLE + número na coluna de pareceres (avaliado por linha)
+_PRL_RE = re.compile(r"\b(PRL[PE])\s*(\d+)\b")
+
+# XPaths dos scrapers, compilados uma vez na importação
+# pré-filtro no libxml2: linhas com ao menos 5 células cuja situação contém "Em tramitação";
+# a igualdade exata (.strip(), que também trata NBSP) continua sendo conferida em Python
+_XP_PROCEDIMENTOS = ET.XPath("//table//tr[td[5]][contains(td[4], 'Em tramitação')]")
+_XP_CELULAS = ET.XPath("./td")
+
 # -----------------------------------------------------------------------------
 # HTTP SESSION (com Retry)
 # -----------------------------------------------------------------------------
@@ -45,13 +63,15 @@ def build_session():
         allowed_methods=["GET"],
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retries)
+    # pool do tamanho do executor, para que as buscas paralelas reaproveitem conexões
+    adapter = HTTPAdapter(max_retries=retries, pool_connections=32, pool_maxsize=32)
     s.mount("http://", adapter)
     s.mount("https://", adapter)
     s.headers.update({
         "Accept": "text/html,application/json",
         "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
-        "Accept-Encoding": "gzip, deflate, br",
+        # só anuncia br/zstd quando o urllib3 consegue decodificar (brotli instalado)
+        "Accept-Encoding": ACCEPT_ENCODING,
         "Connection": "keep-alive",
         "Upgrade-Insecure-Requests": "1",
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -60,35 +80,103 @@ def build_session():
 
 SESSION = build_session()
 
+# Executor para as chamadas de enriquecimento (I/O-bound) feitas por item da pauta
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="enriquecimento")
+# Executor separado para as pautas dos eventos: cada pauta usa o _EXECUTOR
+# internamente, e compartilhar o mesmo pool poderia travar por esgotamento
+_EXECUTOR_EVENTOS = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pauta")
+
 # -----------------------------------------------------------------------------
-# CACHE TTL SIMPLES
+# CACHE TTL (em disco: compartilhado entre workers do gunicorn e reloads)
 # -----------------------------------------------------------------------------
-_CACHE = {}
+_CACHE_DIR = os.environ.get("CACHE_DIR", os.path.join(tempfile.gettempdir(), "pautaplenario"))
+# política padrão (least-recently-stored): com LRU cada get viraria uma escrita no sqlite,
+# e o enriquecimento da pauta faz ~2 leituras por item; o TTL curto já renova as entradas
+_CACHE = diskcache.Cache(_CACHE_DIR, size_limit=64 << 20)
+# prefixo de todas as chaves: o cache sobrevive a deploys, então incremente sempre que
+# mudar o parsing ou a forma dos valores guardados (invalida os derivados antigos)
+_CACHE_VERSAO = "v2"
 _TTL_SECONDS = 300
-
-def _now():
-    from time import time
-    return time()
+# validadores HTTP (ETag/Last-Modified) vivem mais que o TTL: depois que a entrada
+# expira, o refetch vira um GET condicional e, no 304, o valor anterior é reaproveitado
+_VALIDADORES_TTL_SECONDS = 24 * 3600
 
 def _cache_get(key):
-    v = _CACHE.get(key)
-    if not v:
-        return None
-    val, ts = v
-    if _now() - ts > _TTL_SECONDS:
-        _CACHE.pop(key, None)
+    try:
+        return _CACHE.get(f"{_CACHE_VERSAO}:{key}")
+    except Exception:
+        # entrada ilegível (ex.: gravada por outra versão do app) vale como miss
+        logger.warning(f"cache: falha ao ler {key}", exc_info=True)
         return None
-    return val
 
-def _cache_set(key, val):
-    # evita crescimento infinito (máx ~200 itens)
-    if len(_CACHE) > 200:
-        _CACHE.pop(next(iter(_CACHE)))
-    _CACHE[key] = (val, _now())
+def _cache_set(key, val, r=None):
+    # chamado também nos fallbacks de erro: falha do cache (sqlite travado/cheio) não pode virar 500
+    try:
+        _CACHE.set(f"{_CACHE_VERSAO}:{key}", val, expire=_TTL_SECONDS)
+        # validadores só de um 200 já processado com sucesso (quem chama passa r nesse caso)
+        if r is not None and r.status_code == 200:
+            etag = r.headers.get("ETag")
+            last_modified = r.headers.get("Last-Modified")
+            if etag or last_modified:
+                _CACHE.set(f"{_CACHE_VERSAO}:{key}:http", (val, etag, last_modified),
+                           expire=_VALIDADORES_TTL_SECONDS)
+    except Exception:
+        logger.warning(f"cache: falha ao gravar {key}", exc_info=True)
+
+def _get_condicional(key, url, **kwargs):
+    """GET com If-None-Match/If-Modified-Since a partir da última resposta guardada em key.
+    Retorna (r, anterior): no 304, anterior é o valor já calculado (recolocado no cache);
+    caso contrário anterior é None e r deve ser processada normalmente."""
+    guardado = _cache_get(f"{key}:http")
+    headers = {}
+    if guardado:
+        _, etag, last_modified = guardado
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    r = SESSION.get(url, headers=headers, **kwargs)
+    if r.status_code == 304 and guardado:
+        # só renova a entrada de TTL curto; os validadores não ganham prazo novo, para que
+        # um valor antigo não seja reaproveitado indefinidamente enquanto a página não muda
+        _cache_set(key, guardado[0])
+        return r, guardado[0]
+    return r, None
+
+# -----------------------------------------------------------------------------
+# SINGLE-FLIGHT (coalesce buscas concorrentes da mesma chave)
+# -----------------------------------------------------------------------------
+_INFLIGHT = {}
+_INFLIGHT_LOCK = Lock()
+
+def _single_flight(fn):
+    """Chamadas concorrentes com os mesmos argumentos aguardam o Future da primeira,
+    que executa a busca na própria thread; assim só uma vai ao upstream."""
+    @wraps(fn)
+    def wrapper(*args):
+        key = (fn.__name__,) + args
+        with _INFLIGHT_LOCK:
+            fut = _INFLIGHT.get(key)
+            dono = fut is None
+            if dono:
+                fut = _INFLIGHT[key] = Future()
+        if not dono:
+            return fut.result()
+        try:
+            fut.set_result(fn(*args))
+        except BaseException as e:
+            fut.set_exception(e)
+        finally:
+            with _INFLIGHT_LOCK:
+                _INFLIGHT.pop(key, None)
+        return fut.result()
+    return wrapper
 
 # -----------------------------------------------------------------------------
 # UTILS
 # -----------------------------------------------------------------------------
+# função pura e com entradas muito repetidas (mesmos horários de eventos)
+@lru_cache(maxsize=4096)
 def _parse_datetime_flex(dt_str):
     if not dt_str:
         return "N/D"
@@ -118,62 +206,153 @@ def _get(d, *path, default=""):
             return default
     return cur if cur is not None else default
 
+def _html(r):
+    """Árvore lxml a partir dos bytes da resposta (mesmo charset que r.text usaria)."""
+    return lxml.html.fromstring(r.content, parser=lxml.html.HTMLParser(encoding=r.encoding))
+
+def _json(r):
+    """Decodifica o JSON direto dos bytes da resposta, sem passar por r.text.
+    orjson.JSONDecodeError herda de ValueError, então os fallbacks XML continuam valendo."""
+    return orjson.loads(r.content)
+
+def _texto(trechos):
+    """Junta os trechos crus da célula e normaliza os espaços uma única vez.
+    (o libxml2 quebra um mesmo nó de texto em vários data(): em cada entidade
+    e nas fronteiras do buffer, então os trechos não podem ser limpos isoladamente)"""
+    return " ".join("".join(trechos).split())
+
+class _ColetorTabelas:
+    """Alvo (target) do lxml.etree.HTMLParser: recebe os eventos do parser e guarda
+    só os textos das tabelas, sem montar a árvore do documento.
+    close() devolve [{"ths": [...], "linhas": [[texto_td, ...], ...]}, ...]."""
+
+    def __init__(self):
+        self.tabelas = []
+        # tabelas abertas (aninhamento), cada uma [tabela, linha_atual, trechos_da_celula_atual];
+        # a célula fica por tabela para que uma <table> dentro de <td> não descarte a externa
+        self._abertas = []
+
+    def _separar(self):
+        # qualquer tag dentro de uma célula separa palavras, como get_text(" ")
+        for aberta in self._abertas:
+            if aberta[2] is not None:
+                aberta[2].append(" ")
+
+    def start(self, tag, attrib):
+        self._separar()
+        if tag == "table":
+            tabela = {"ths": [], "linhas": []}
+            self.tabelas.append(tabela)
+            self._abertas.append([tabela, None, None])
+        elif not self._abertas:
+            return
+        elif tag == "tr":
+            atual = self._abertas[-1]
+            atual[1] = []
+            atual[0]["linhas"].append(atual[1])
+        elif tag in ("td", "th"):
+            self._abertas[-1][2] = []
+
+    def end(self, tag):
+        self._separar()
+        if not self._abertas:
+            return
+        atual = self._abertas[-1]
+        if tag == "table":
+            self._abertas.pop()
+        elif tag in ("td", "th") and atual[2] is not None:
+            texto = _texto(atual[2])
+            if tag == "th":
+                atual[0]["ths"].append(texto)
+            elif atual[1] is not None:
+                atual[1].append(texto)
+            atual[2] = None
+        elif tag == "tr":
+            atual[1] = None
+
+    def data(self, data):
+        # o texto de uma tabela aninhada também compõe a célula externa (como text_content())
+        for aberta in self._abertas:
+            if aberta[2] is not None:
+                aberta[2].append(data)
+
+    def close(self):
+        return self.tabelas
+
+def _tabelas_html(r):
+    """Tabelas da página, processadas em fluxo a partir dos bytes da resposta."""
+    parser = ET.HTMLParser(target=_ColetorTabelas(), encoding=r.encoding)
+    parser.feed(r.content)
+    return parser.close()
+
+def _as_dict(v):
+    # no fallback XML os campos aninhados chegam como texto (ou None)
+    return v if isinstance(v, dict) else {}
+
 # --- helper para extrair a proposição principal do item da pauta (trata PPP e PEP) ---
+# (acessos diretos em vez de _get: roda uma vez por item da pauta)
 def _principal_from_item(item_raw):
-    prop = _get(item_raw, "proposicao_", default={}) or {}
-    relacionada = _get(item_raw, "proposicaoRelacionada_", default={}) or {}
+    prop = _as_dict(item_raw.get("proposicao_"))
+    relacionada = _as_dict(item_raw.get("proposicaoRelacionada_"))
 
-    sigla_tipo = _get(prop, "siglaTipo", default="")
-    cod_tipo   = _get(prop, "codTipo", default=None)
+    sigla_tipo = prop.get("siglaTipo") or ""
+    cod_tipo   = prop.get("codTipo")
     is_relacionada = (sigla_tipo in ["PPP", "PEP"]) or (cod_tipo in [192, 442])  # <-- Correção: inclui PEP (sigla/cod 442)
 
     if is_relacionada and relacionada:
-        principal_id  = _get(relacionada, "id")
-        ementa_ok     = _get(relacionada, "ementa", default="")
+        principal_id  = relacionada.get("id")
+        ementa_ok     = relacionada.get("ementa") or ""
     else:
-        principal_id  = _get(prop, "id")
-        ementa_ok     = _get(prop, "ementa", default="")
+        principal_id  = prop.get("id")
+        ementa_ok     = prop.get("ementa") or ""
 
     return principal_id, ementa_ok
 
 # -----------------------------------------------------------------------------
-# MODELOS (objetos simples)
+# MODELOS (dataclasses imutáveis com __slots__: leves e baratas de serializar no cache)
 # -----------------------------------------------------------------------------
+@dataclass(slots=True, frozen=True)
 class Evento:
-    def __init__(self, id_evento, data_hora_inicio, situacao, descricao_tipo, descricao):
-        self.id_evento = id_evento
-        self.data_hora_inicio = _parse_datetime_flex(data_hora_inicio)
-        self.situacao = situacao
-        self.descricao_tipo = descricao_tipo
-        self.descricao = descricao
+    id_evento: str
+    data_hora_inicio: str
+    situacao: str
+    descricao_tipo: str
+    descricao: str
+
+    def __post_init__(self):
+        object.__setattr__(self, "data_hora_inicio", _parse_datetime_flex(self.data_hora_inicio))
 
+@dataclass(slots=True, frozen=True)
 class DestaqueEmenda:
-    def __init__(self, numero, autoria, descricao, tipo_destaque, situacao):
-        self.numero = numero
-        self.autoria = autoria
-        self.descricao = descricao
-        self.tipo_destaque = tipo_destaque
-        self.situacao = situacao
+    numero: str
+    autoria: str
+    descricao: str
+    tipo_destaque: str
+    situacao: str
 
+@dataclass(slots=True, frozen=True)
 class ParecerSubstitutivoVoto:
-    def __init__(self, tipo_proposicao, data_apresentacao, autor, descricao, link_inteiro_teor):
-        self.tipo_proposicao = tipo_proposicao
-        self.data_apresentacao = data_apresentacao
-        self.autor = autor
-        self.descricao = descricao or "Descrição não disponível"
-        self.link_inteiro_teor = link_inteiro_teor
+    tipo_proposicao: str
+    data_apresentacao: str
+    autor: str
+    descricao: str
+    link_inteiro_teor: str
 
+    def __post_init__(self):
+        object.__setattr__(self, "descricao", self.descricao or "Descrição não disponível")
+
+@dataclass(slots=True, frozen=True)
 class Procedimento:
-    def __init__(self, numero, autoria, descricao, situacao, data):
-        self.numero = numero
-        self.autoria = autoria
-        self.descricao = descricao
-        self.situacao = situacao
-        self.data = data
+    numero: str
+    autoria: str
+    descricao: str
+    situacao: str
+    data: str
 
 # -----------------------------------------------------------------------------
 # SERVIÇOS DE DADOS
 # -----------------------------------------------------------------------------
+@_single_flight
 def obter_eventos_dia(data_str):
     """Busca eventos do PLEN no dia e filtra Sessão Deliberativa."""
     ck = f"eventos:{data_str}"
@@ -189,16 +368,18 @@ def obter_eventos_dia(data_str):
             "ordem": "ASC",
             "ordenarPor": "dataHoraInicio",
         }
-        r = SESSION.get(url, params=params, timeout=15)
+        r, anterior = _get_condicional(ck, url, params=params, timeout=15)
+        if anterior is not None:
+            return anterior
         r.raise_for_status()
         try:
-            dados = r.json().get("dados", []) or []
+            dados = _json(r).get("dados", []) or []
         except ValueError:
             # fallback XML
-            root = ET.fromstring(r.text)
+            root = ET.fromstring(r.content)
             dados = []
             for e in root.findall(".//evento_"):
-                dados.append({c.tag: c.text for c in e})
+                dados.append({c.tag: c.text for c in e if isinstance(c.tag, str)})
 
         eventos_delib = [
             Evento(
@@ -216,57 +397,66 @@ def obter_eventos_dia(data_str):
             "eventos": eventos_delib,
             "erro": None if eventos_delib else f"Nenhuma sessão deliberativa em {data_str}."
         }
-        _cache_set(ck, res)
+        _cache_set(ck, res, r)
         return res
     except Exception as e:
         res = {"tem_sessao": False, "eventos": [], "erro": f"Erro na API: {e}"}
         _cache_set(ck, res)
         return res
 
+@_single_flight
 def obter_detalhes_proposicao(id_proposicao):
     ck = f"prop:{id_proposicao}"
     c = _cache_get(ck)
     if c is not None:
         return c
     try:
-        r = SESSION.get(f"{API_URL}/proposicoes/{id_proposicao}", timeout=12)
+        r, anterior = _get_condicional(ck, f"{API_URL}/proposicoes/{id_proposicao}", timeout=12)
+        if anterior is not None:
+            return anterior
         r.raise_for_status()
         try:
-            d = r.json().get("dados", {}) or {}
+            d = _json(r).get("dados", {}) or {}
         except ValueError:
-            root = ET.fromstring(r.text)
-            d = {c.tag: c.text for c in root.find(".//proposicao_") or []}
+            root = ET.fromstring(r.content)
+            # isinstance(c.tag, str): lxml também entrega comentários/PIs ao iterar os filhos
+            el = root.find(".//proposicao_")
+            d = {} if el is None else {c.tag: c.text for c in el if isinstance(c.tag, str)}
         descricao = _get(d, "statusProposicao", "descricaoSituacao", default="Não Informada")
         payload = {"descricao_situacao": descricao}
-        _cache_set(ck, payload)
+        _cache_set(ck, payload, r)
         return payload
     except Exception as e:
         return {"descricao_situacao": f"Erro: {e}"}
 
+@_single_flight
 def obter_autores_proposicao(id_proposicao):
     ck = f"autores:{id_proposicao}"
     c = _cache_get(ck)
     if c is not None:
         return c
     try:
-        r = SESSION.get(f"{API_URL}/proposicoes/{id_proposicao}/autores", timeout=12)
+        r, anterior = _get_condicional(ck, f"{API_URL}/proposicoes/{id_proposicao}/autores", timeout=12)
+        if anterior is not None:
+            return anterior
         r.raise_for_status()
         try:
-            dados = r.json().get("dados", []) or []
+            dados = _json(r).get("dados", []) or []
         except ValueError:
-            root = ET.fromstring(r.text)
+            root = ET.fromstring(r.content)
             dados = []
             for el in root.findall(".//autor_"):
-                dados.append({c.tag: c.text for c in el})
+                dados.append({c.tag: c.text for c in el if isinstance(c.tag, str)})
         autores = [{"nome": (a.get("nome") or (a.get("autor") or {}).get("nome") or "Desconhecido")} for a in dados[:2]]
         result = {"autores": autores, "tem_mais_autores": len(dados) > 2}
-        _cache_set(ck, result)
+        _cache_set(ck, result, r)
         return result
     except Exception:
         result = {"autores": [], "tem_ais_autores": False}
         _cache_set(ck, result)
         return result
 
+@_single_flight
 def obter_destaques_emendas(id_proposicao):
     ck = f"destaques:{id_proposicao}"
     c = _cache_get(ck)
@@ -274,37 +464,31 @@ def obter_destaques_emendas(id_proposicao):
         return c
     try:
         url = f"{URL_DESTAQUES}?codOrgao={PLENARIO_ID}&codProposicao={id_proposicao}"
-        r = SESSION.get(url, timeout=20)
+        r, anterior = _get_condicional(ck, url, timeout=20)
+        if anterior is not None:
+            return anterior
         if r.status_code != 200:
             raise Exception(f"HTTP {r.status_code}")
-        soup = BeautifulSoup(r.text, "lxml")
         destaques = []
-        for tabela in soup.find_all("table"):
-            rows = tabela.find_all("tr")[1:]
-            for row in rows:
-                cols = row.find_all("td")
-                if len(cols) < 5:
-                    continue
-                situacao = cols[4].text.strip()
-                if situacao != "Em tramitação":
+        for tabela in _tabelas_html(r):
+            for cols in tabela["linhas"][1:]:
+                if len(cols) < 5 or cols[4] != "Em tramitação":
                     continue
-                numero = cols[0].text.strip()
-                autoria = cols[1].text.strip()
-                descricao = (cols[2].text or "").strip() or "Descrição não disponível"
-                tipo = cols[3].text.strip()
-                destaques.append(DestaqueEmenda(numero, autoria, descricao, tipo, situacao))
+                numero, autoria, descricao, tipo, situacao = cols[:5]
+                destaques.append(DestaqueEmenda(numero, autoria, descricao or "Descrição não disponível", tipo, situacao))
         res = {
             "tem_destaques_emendas": len(destaques) > 0,
             "destaques_emendas": destaques,
             "erro": None if destaques else "Nenhum destaque/emenda em tramitação"
         }
-        _cache_set(ck, res)
+        _cache_set(ck, res, r)
         return res
     except Exception as e:
         res = {"tem_destaques_emendas": False, "destaques_emendas": [], "erro": f"Erro no scraping: {e}"}
         _cache_set(ck, res)
         return res
 
+@_single_flight
 def obter_pareceres_substitutivos_votos(id_proposicao):
     """
     Captura SOMENTE PRLP e PRLE. 
@@ -319,18 +503,15 @@ def obter_pareceres_substitutivos_votos(id_proposicao):
 
     try:
         url = f"{URL_PARECERES}?idProposicao={id_proposicao}"
-        r = SESSION.get(url, timeout=25)
+        r, anterior = _get_condicional(ck, url, timeout=25)
+        if anterior is not None:
+            return anterior
         if r.status_code != 200:
             raise Exception(f"HTTP {r.status_code}")
 
-        soup = BeautifulSoup(r.text, "lxml")
-
-        def normtxt(s):
-            return (s or "").strip()
-
         candidatos = []  # [{"tipo": "PRLP"/"PRLE", "numero": int, ...}]
-        for tabela in soup.find_all("table"):
-            ths = [normtxt(th.get_text(" ", strip=True)).lower() for th in tabela.find_all("th")]
+        for tabela in _tabelas_html(r):
+            ths = [th.lower() for th in tabela["ths"]]
             if not ths:
                 continue
 
@@ -352,18 +533,13 @@ def obter_pareceres_substitutivos_votos(id_proposicao):
             if min(idx_psv, idx_tipo, idx_data, idx_aut, idx_desc) < 0:
                 continue
 
-            for tr in tabela.find_all("tr")[1:]:
-                tds = tr.find_all("td")
-                if len(tds) < max(idx_desc, idx_aut, idx_data, idx_tipo, idx_psv) + 1:
+            # textos das células já vêm extraídos (e limpos) pelo coletor
+            for textos in tabela["linhas"][1:]:
+                if len(textos) < max(idx_desc, idx_aut, idx_data, idx_tipo, idx_psv) + 1:
                     continue
 
-                col_psv  = tds[idx_psv]
-                col_data = tds[idx_data]
-                col_aut  = tds[idx_aut]
-                col_desc = tds[idx_desc]
-
-                txt_psv = normtxt(col_psv.get_text(" ", strip=True))
-                m = re.search(r"\b(PRL[PE])\s*(\d+)\b", txt_psv)
+                txt_psv = textos[idx_psv]
+                m = _PRL_RE.search(txt_psv)
                 if not m:
                     continue
 
@@ -372,11 +548,11 @@ def obter_pareceres_substitutivos_votos(id_proposicao):
                     continue
 
                 numero   = int(m.group(2))
-                data_ap  = normtxt(col_data.get_text(" ", strip=True)) or "N/D"
-                autor    = normtxt(col_aut.get_text(" ", strip=True)) or "N/D"
+                data_ap  = textos[idx_data] or "N/D"
+                autor    = textos[idx_aut] or "N/D"
 
                 # descrição (limpa qualquer "Inteiro teor" que venha junto)
-                descricao_raw = normtxt(col_desc.get_text(" ", strip=True)) or "Descrição não disponível"
+                descricao_raw = textos[idx_desc] or "Descrição não disponível"
                 descricao = descricao_raw.replace("Inteiro teor", "").strip() or "Descrição não disponível"
 
                 # Link estável para a página de histórico da proposição
@@ -396,7 +572,7 @@ def obter_pareceres_substitutivos_votos(id_proposicao):
 
         if not candidatos:
             res = {"tem_pareceres": False, "pareceres_substitutivos_votos": [], "erro": "Nenhum PRLP/PRLE encontrado"}
-            _cache_set(ck, res)
+            _cache_set(ck, res, r)
             return res
 
         # Separa por tipo e pega o de maior número em cada tipo
@@ -424,7 +600,7 @@ def obter_pareceres_substitutivos_votos(id_proposicao):
         ]
 
         res = {"tem_pareceres": len(items) > 0, "pareceres_substitutivos_votos": items, "erro": None}
-        _cache_set(ck, res)
+        _cache_set(ck, res, r)
         return res
 
     except Exception as e:
@@ -434,6 +610,7 @@ def obter_pareceres_substitutivos_votos(id_proposicao):
 
 
 
+@_single_flight
 def obter_procedimentos_regimentais(id_proposicao):
     ck = f"proced:{id_proposicao}"
     c = _cache_get(ck)
@@ -441,84 +618,107 @@ def obter_procedimentos_regimentais(id_proposicao):
         return c
     try:
         url = f"{URL_REQUERIMENTOS}?codOrgao={PLENARIO_ID}&codProposicao={id_proposicao}"
-        r = SESSION.get(url, timeout=20)
+        r, anterior = _get_condicional(ck, url, timeout=20)
+        if anterior is not None:
+            return anterior
         if r.status_code != 200:
             raise Exception(f"HTTP {r.status_code}")
-        soup = BeautifulSoup(r.text, "lxml")
+        doc = _html(r)
         procs = []
-        for tabela in soup.find_all("table"):
-            for row in tabela.find_all("tr")[1:]:
-                cols = row.find_all("td")
-                if len(cols) < 5:
-                    continue
-                situ = cols[3].text.strip()
-                if situ != "Em tramitação":
-                    continue
-                data_raw = cols[4].text.strip()
-                try:
-                    data_fmt = datetime.strptime(data_raw, "%d/%m/%Y").strftime("%d/%m/%Y")
-                except Exception:
-                    data_fmt = data_raw or "N/D"
-                procs.append(Procedimento(
-                    numero=cols[0].text.strip(),
-                    autoria=cols[1].text.strip(),
-                    descricao=cols[2].text.strip(),
-                    situacao=situ,
-                    data=data_fmt
-                ))
+        for row in _XP_PROCEDIMENTOS(doc):
+            cols = _XP_CELULAS(row)
+            situ = cols[3].text_content().strip()
+            if situ != "Em tramitação":
+                continue
+            data_raw = cols[4].text_content().strip()
+            try:
+                data_fmt = datetime.strptime(data_raw, "%d/%m/%Y").strftime("%d/%m/%Y")
+            except Exception:
+                data_fmt = data_raw or "N/D"
+            procs.append(Procedimento(
+                numero=cols[0].text_content().strip(),
+                autoria=cols[1].text_content().strip(),
+                descricao=cols[2].text_content().strip(),
+                situacao=situ,
+                data=data_fmt
+            ))
         res = {
             "tem_procedimentos": len(procs) > 0,
             "procedimentos": procs,
             "erro": None if procs else "Nenhum requerimento procedimental em tramitação"
         }
-        _cache_set(ck, res)
+        _cache_set(ck, res, r)
         return res
     except Exception as e:
         res = {"tem_procedimentos": False, "procedimentos": [], "erro": f"Erro no scraping: {e}"}
         _cache_set(ck, res)
         return res
 
+@_single_flight
 def obter_pauta_por_evento(evento_id):
     ck = f"pauta:{evento_id}"
     c = _cache_get(ck)
     if c is not None:
         return c
     try:
+        # sem GET condicional: o valor em cache embute situação/autores de cada item,
+        # que podem mudar mesmo com a pauta inalterada
         r = SESSION.get(f"{API_URL}/eventos/{evento_id}/pauta", timeout=15)
         r.raise_for_status()
         try:
-            dados_pauta = r.json().get("dados", []) or []
+            dados_pauta = _json(r).get("dados", []) or []
         except ValueError:
-            root = ET.fromstring(r.text)
-            dados_pauta = [{c.tag: c.text for c in item} for item in root.findall(".//item_") or []]
+            # pauta pode ser grande: processa item a item e libera cada subárvore
+            dados_pauta = []
+            for _, item in ET.iterparse(BytesIO(r.content), events=("end",), tag="item_"):
+                dados_pauta.append({c.tag: c.text for c in item if isinstance(c.tag, str)})
+                item.clear()
 
         logger.info(f"evento {evento_id}: itens na pauta = {len(dados_pauta)}")
 
-        itens = []
+        principais = []
         seen = set()
         for item in dados_pauta:
             principal_id, ementa_ok = _principal_from_item(item)
             if not principal_id or principal_id in seen:
                 continue
             seen.add(principal_id)
+            principais.append((principal_id, ementa_ok, item))
+
+        # detalhes e autores de todas as proposições numa única onda paralela;
+        # o que já está no cache é resolvido aqui, sem passar pelo executor
+        detalhes, autores = {}, {}
+        pendentes = []
+        for pid, _, _ in principais:
+            for destino, fn, ck_item in ((detalhes, obter_detalhes_proposicao, f"prop:{pid}"),
+                                         (autores, obter_autores_proposicao, f"autores:{pid}")):
+                cached = _cache_get(ck_item)
+                if cached is not None:
+                    destino[pid] = cached
+                else:
+                    pendentes.append((destino, pid, _EXECUTOR.submit(fn, pid)))
+        for destino, pid, fut in pendentes:
+            destino[pid] = fut.result()
 
-            det   = obter_detalhes_proposicao(principal_id)
-            autores = obter_autores_proposicao(principal_id)
-
+        itens = []
+        for principal_id, ementa_ok, item in principais:
+            det = detalhes[principal_id]
+            ordem = item.get("ordem")
+            relator = _as_dict(item.get("relator"))
             itens.append({
-                "ordem": _get(item, "ordem", default="N/D"),
-                "regime": _get(item, "regime", default=""),
-                "titulo": _get(item, "titulo", default=""),
+                "ordem": "N/D" if ordem is None else ordem,
+                "regime": item.get("regime") or "",
+                "titulo": item.get("titulo") or "",
                 "id_proposicao": principal_id,
                 "ementa": ementa_ok,
-                "relator_id": _get(item, "relator", "id", default=""),
-                "relator_nome": _get(item, "relator", "nome", default=""),
-                "relator_sigla_partido": _get(item, "relator", "siglaPartido", default=""),
-                "relator_url_foto": _get(item, "relator", "urlFoto", default=""),
+                "relator_id": relator.get("id") or "",
+                "relator_nome": relator.get("nome") or "",
+                "relator_sigla_partido": relator.get("siglaPartido") or "",
+                "relator_url_foto": relator.get("urlFoto") or "",
                 "descricao_situacao": det.get("descricao_situacao"),
                 "destaques_emendas": [],
                 "procedimentos": [],
-                "autores": autores,
+                "autores": autores[principal_id],
                 "pareceres_substitutivos_votos": [],
             })
 
@@ -536,6 +736,10 @@ def obter_pauta_por_evento(evento_id):
 # -----------------------------------------------------------------------------
 app = Flask(__name__, static_url_path="/static", static_folder="static", template_folder="templates")
 
+def _orjson_response(payload):
+    """Como jsonify, mas serializa com orjson (usado no payload maior, a pauta)."""
+    return app.response_class(orjson.dumps(payload), mimetype="application/json")
+
 # Página shell (UI carrega via AJAX)
 @app.route("/", methods=["GET"])
 def home():
@@ -568,17 +772,17 @@ def api_pauta(data_str):
     itens_merged = []
     eventos_res = obter_eventos_dia(data_str)
     if not eventos_res["tem_sessao"]:
-        return jsonify({"tem_pauta": False, "itens": [], "erro": eventos_res["erro"], "eventos": []})
+        return _orjson_response({"tem_pauta": False, "itens": [], "erro": eventos_res["erro"], "eventos": []})
 
     eventos = [{"id_evento": e.id_evento, "situacao": e.situacao, "descricao_tipo": e.descricao_tipo,
                 "data_hora_inicio": e.data_hora_inicio, "descricao": e.descricao} for e in eventos_res["eventos"]]
 
     alvo = [ev for ev in eventos if (not evento_id or ev["id_evento"] == evento_id)]
-    for ev in alvo:
-        pauta = obter_pauta_por_evento(ev["id_evento"])
+    # pautas dos eventos em paralelo; map preserva a ordem dos eventos
+    for pauta in _EXECUTOR_EVENTOS.map(obter_pauta_por_evento, [ev["id_evento"] for ev in alvo]):
         itens_merged.extend(pauta["itens"])
 
-    return jsonify({
+    return _orjson_response({
         "tem_pauta": len(itens_merged) > 0,
         "itens": itens_merged,
         "eventos": eventos,
@@ -591,7 +795,7 @@ def api_proposicao_situacao(proposicao_id: int):
     try:
         r = SESSION.get(f"{API_URL}/proposicoes/{proposicao_id}", timeout=12)
         r.raise_for_status()
-        j = r.json()
+        j = _json(r)
         dados = j.get("dados") or {}
         status = dados.get("statusProposicao") or {}
         descricao = status.get("descricaoSituacao") or dados.get("descricaoSituacao")
@@ -0,0 +1,68 @@
+import os
+import sys
+import tempfile
+
+import requests
+
+# app.py grava app.log no diretório atual e abre o cache em disco na importação
+_TMP = tempfile.mkdtemp()
+os.environ.setdefault("CACHE_DIR", os.path.join(_TMP, "cache"))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_cwd = os.getcwd()
+os.chdir(_TMP)
+try:
+    import app
+finally:
+    os.chdir(_cwd)
+
+
+def _resp(html):
+    r = requests.Response()
+    r.status_code = 200
+    r._content = html.encode("utf-8")
+    r.headers["Content-Type"] = "text/html; charset=utf-8"
+    r.encoding = "utf-8"
+    return r
+
+
+def test_entidades_nao_quebram_o_texto_da_celula():
+    html = (
+        "<table><tr><th>N&uacute;mero</th><th>Autoria</th></tr>"
+        "<tr><td>Jo&atilde;o <b>da</b>Silva</td><td>Em tramita&ccedil;&atilde;o&nbsp;</td></tr></table>"
+    )
+    tabelas = app._tabelas_html(_resp(html))
+    assert tabelas[0]["ths"] == ["Número", "Autoria"]
+    assert tabelas[0]["linhas"][1] == ["João da Silva", "Em tramitação"]
+
+
+def test_celula_grande_nao_ganha_espacos():
+    texto = "parecer " * 20000
+    html = f"<table><tr><th>D</th></tr><tr><td>{texto}</td></tr></table>"
+    tabelas = app._tabelas_html(_resp(html))
+    assert tabelas[0]["linhas"][1] == [texto.strip()]
+
+
+def test_tabela_aninhada_nao_descarta_a_celula_externa():
+    html = (
+        "<table><tr><th>A</th><th>B</th><th>C</th></tr>"
+        "<tr><td>x</td><td>antes<table><tr><td>dentro</td></tr></table>depois</td><td>z</td></tr></table>"
+    )
+    externa, interna = app._tabelas_html(_resp(html))
+    assert externa["linhas"][1] == ["x", "antes dentro depois", "z"]
+    assert interna["linhas"] == [["dentro"]]
+
+
+def test_destaques_em_tramitacao(monkeypatch):
+    html = (
+        "<table><tr><th>N</th><th>Autoria</th><th>Descri&ccedil;&atilde;o</th><th>Tipo</th><th>Situa&ccedil;&atilde;o</th></tr>"
+        "<tr><td>DTQ 1</td><td>Jo<b>da</b>Silva</td><td>Desc\n  linha</td><td>Simples</td><td>Em tramita&ccedil;&atilde;o</td></tr>"
+        "<tr><td>DTQ 2</td><td>B</td><td></td><td>Simples</td><td>Arquivado</td></tr>"
+        "<tr><td>DTQ 3</td><td>C</td><td></td><td>Bancada</td><td>Em tramita&ccedil;&atilde;o&nbsp;</td></tr></table>"
+    )
+    monkeypatch.setattr(app.SESSION, "get", lambda url, **kwargs: _resp(html))
+    res = app.obter_destaques_emendas(990001)
+    assert res["tem_destaques_emendas"]
+    assert [(d.numero, d.autoria, d.descricao, d.situacao) for d in res["destaques_emendas"]] == [
+        ("DTQ 1", "Jo da Silva", "Desc linha", "Em tramitação"),
+        ("DTQ 3", "C", "Descrição não disponível", "Em tramitação"),
+    ]